@@ -1,15 +1,31 @@
+import gzip
+import hashlib
+import heapq
 import html
 import json
+import math
 import os
+import re
+import time
+import unicodedata
 import uuid
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
+import click
 import requests
 from azure.cosmos import CosmosClient, PartitionKey, exceptions
 from dotenv import load_dotenv
 from flask import Flask, Response, request
 from flask_cors import CORS
 
+try:
+    import brotli
+except ImportError:  # optional: fall back to gzip only
+    brotli = None
+
 load_dotenv()
 app = Flask(__name__)
 CORS(
@@ -26,21 +42,39 @@ cosmos_client = CosmosClient(COSMOS_URI, credential=COSMOS_KEY)
 database = cosmos_client.create_database_if_not_exists(id=COSMOS_DB_NAME)
 
 
-def _get_or_create_container(id: str, pk_path: str):
+def _get_or_create_container(id: str, pk_path, default_ttl=None):
+    # A list of paths creates a hierarchical (MultiHash) partition key.
+    # default_ttl=-1 enables per-item "ttl" without expiring items by default
+    kind = "MultiHash" if isinstance(pk_path, list) else "Hash"
+    options = {} if default_ttl is None else {"default_ttl": default_ttl}
     try:
         return database.create_container_if_not_exists(
             id=id,
-            partition_key=PartitionKey(path=pk_path),
+            partition_key=PartitionKey(path=pk_path, kind=kind),
+            **options,
         )
     except Exception:
         # If permissions or throughput configuration cause creation to fail, fall back to get_container_client
         return database.get_container_client(id)
 
 
-posts_container = _get_or_create_container("posts", "/board_id")
+# Posts layout: "board" keeps every post of a board in one logical partition;
+# "monthly" stores posts in posts_v2 under the hierarchical key [board_id, month]
+POSTS_LAYOUT = os.getenv("POSTS_LAYOUT", "board")
+# Like records expire after this many days (0 keeps them forever)
+LIKES_TTL_DAYS = int(os.getenv("LIKES_TTL_DAYS", 0))
+
+legacy_posts_container = _get_or_create_container("posts", "/board_id")
+if POSTS_LAYOUT == "monthly":
+    posts_container = _get_or_create_container("posts_v2", ["/board_id", "/month"])
+else:
+    posts_container = legacy_posts_container
 comments_container = _get_or_create_container("comments", "/post_id")
 counters_container = _get_or_create_container("counters", "/board_id")
-likes_container = _get_or_create_container("likes", "/post_id")
+likes_container = _get_or_create_container(
+    "likes", "/post_id", default_ttl=LIKES_TTL_DAYS * 86400 or None
+)
+search_container = _get_or_create_container("search_index", "/board_id")
 
 
 def increment_post_id_counter(board_id):
@@ -78,7 +112,230 @@ def increment_post_id_counter(board_id):
     raise RuntimeError("Failed to increment counter due to concurrent updates")
 
 
-def response_json(data, status=200):
+# -----------------------------
+# Posts layout (monthly hierarchical partitions)
+# -----------------------------
+
+POST_MONTHS = OrderedDict()  # { (board_id, post_id): month } for point reads
+POST_MONTHS_MAX = 10000
+BOARD_MONTHS = OrderedDict()  # { board_id: { 'ts': datetime, 'months': set } }
+BOARD_MONTHS_MAX = 1024
+BOARD_MONTHS_TTL = 60
+POSTS_ID_BATCH = 500  # ids per ARRAY_CONTAINS query
+_COSMOS_SYSTEM_FIELDS = ("_rid", "_self", "_etag", "_attachments", "_ts")
+
+
+def post_month(created_at):
+    """Month bucket ("YYYY-MM") of an ISO created_at, current month if unparsable."""
+    if created_at and len(created_at) >= 7 and created_at[4] == "-":
+        return created_at[:7]
+    return datetime.now(timezone.utc).strftime("%Y-%m")
+
+
+def posts_pk(board_id):
+    """Partition key (or hierarchical prefix) covering every post of a board."""
+    return [board_id] if POSTS_LAYOUT == "monthly" else board_id
+
+
+def _remember_post_month(board_id, post_id, month):
+    POST_MONTHS[(board_id, post_id)] = month
+    POST_MONTHS.move_to_end((board_id, post_id))
+    if len(POST_MONTHS) > POST_MONTHS_MAX:
+        POST_MONTHS.popitem(last=False)
+
+
+def _cache_board_months(board_id, months):
+    # LRU: board ids come from the URL, so one entry per requested id would
+    # grow without bound
+    BOARD_MONTHS[board_id] = {"ts": datetime.now(timezone.utc), "months": months}
+    BOARD_MONTHS.move_to_end(board_id)
+    if len(BOARD_MONTHS) > BOARD_MONTHS_MAX:
+        BOARD_MONTHS.popitem(last=False)
+
+
+def board_months(board_id):
+    """Months that hold posts for a board (stored next to the board's counter)."""
+    cache_entry = BOARD_MONTHS.get(board_id)
+    if cache_entry:
+        age = (datetime.now(timezone.utc) - cache_entry["ts"]).total_seconds()
+        if age < BOARD_MONTHS_TTL:
+            BOARD_MONTHS.move_to_end(board_id)
+            return cache_entry["months"]
+    try:
+        doc = counters_container.read_item(
+            item=f"months:{board_id}", partition_key=board_id
+        )
+        months = set(doc.get("months") or [])
+    except exceptions.CosmosResourceNotFoundError:
+        months = set()
+    _cache_board_months(board_id, months)
+    return months
+
+
+def register_board_month(board_id, month):
+    if month in board_months(board_id):
+        return
+    doc_id = f"months:{board_id}"
+    for _ in range(5):
+        try:
+            doc = counters_container.read_item(item=doc_id, partition_key=board_id)
+        except exceptions.CosmosResourceNotFoundError:
+            doc = None
+        months = set((doc or {}).get("months") or [])
+        months.add(month)
+        try:
+            if doc is None:
+                counters_container.create_item(
+                    {"id": doc_id, "board_id": board_id, "months": sorted(months)}
+                )
+            elif month not in (doc.get("months") or []):
+                doc["months"] = sorted(months)
+                counters_container.replace_item(
+                    item=doc_id, body=doc, if_match=doc.get("_etag")
+                )
+            _cache_board_months(board_id, months)
+            return
+        except (
+            exceptions.CosmosAccessConditionFailedError,
+            exceptions.CosmosResourceExistsError,
+        ):
+            continue
+    raise RuntimeError("Failed to register board month due to concurrent updates")
+
+
+def migrate_post(item):
+    """Copy a legacy post into posts_v2. Returns (doc, created)."""
+    doc = {k: v for k, v in item.items() if k not in _COSMOS_SYSTEM_FIELDS}
+    doc["month"] = post_month(doc.get("created_at"))
+    register_board_month(doc["board_id"], doc["month"])
+    try:
+        return posts_container.create_item(doc), True
+    except exceptions.CosmosResourceExistsError:
+        # Already migrated (or rewritten since); the posts_v2 copy wins
+        existing = posts_container.read_item(
+            item=doc["id"], partition_key=[doc["board_id"], doc["month"]]
+        )
+        return existing, False
+
+
+def read_post(board_id, post_id):
+    """Read a post by id, raising CosmosResourceNotFoundError like read_item."""
+    if POSTS_LAYOUT != "monthly":
+        return legacy_posts_container.read_item(item=post_id, partition_key=board_id)
+
+    month = POST_MONTHS.get((board_id, post_id))
+    if month:
+        try:
+            return posts_container.read_item(
+                item=post_id, partition_key=[board_id, month]
+            )
+        except exceptions.CosmosResourceNotFoundError:
+            POST_MONTHS.pop((board_id, post_id), None)
+
+    items = list(
+        posts_container.query_items(
+            query="SELECT * FROM c WHERE c.id=@id",
+            parameters=[{"name": "@id", "value": post_id}],
+            partition_key=[board_id],
+        )
+    )
+    if items:
+        item = items[0]
+    else:
+        # Not migrated yet: copy from the legacy container on first access
+        legacy = legacy_posts_container.read_item(item=post_id, partition_key=board_id)
+        item, _ = migrate_post(legacy)
+    _remember_post_month(board_id, post_id, item.get("month"))
+    return item
+
+
+def _unmigrated(board_id, items):
+    """Drop legacy posts that already have a posts_v2 copy (that copy is current)."""
+    if not items:
+        return []
+    migrated = set(
+        posts_container.query_items(
+            query="SELECT VALUE c.id FROM c WHERE ARRAY_CONTAINS(@ids, c.id)",
+            parameters=[{"name": "@ids", "value": [it["id"] for it in items]}],
+            partition_key=[board_id],
+        )
+    )
+    return [it for it in items if it["id"] not in migrated]
+
+
+def query_board_posts(board_id, query, parameters=None):
+    """Run a query over every post of a board, including posts not migrated yet.
+
+    In monthly mode the query also runs against the legacy container. Results
+    must include c.id and are not ordered across the two containers.
+    """
+    yield from posts_container.query_items(
+        query=query, parameters=parameters, partition_key=posts_pk(board_id)
+    )
+    if POSTS_LAYOUT != "monthly":
+        return
+
+    batch = []
+    for item in legacy_posts_container.query_items(
+        query=query, parameters=parameters, partition_key=board_id
+    ):
+        batch.append(item)
+        if len(batch) >= POSTS_ID_BATCH:
+            yield from _unmigrated(board_id, batch)
+            batch = []
+    yield from _unmigrated(board_id, batch)
+
+
+def query_posts_by_month(board_id, fields, limit, last_created_at=None):
+    """Keyset page (created_at DESC) walking month buckets newest-first.
+
+    The legacy container is paged with the same cursor and merged in by
+    created_at, so posts not migrated yet stay listed in order while
+    posts-migrate runs. Posts found in both are taken from posts_v2.
+    """
+    months = sorted(board_months(board_id), reverse=True)
+    cursor = []
+    where = ""
+    if last_created_at:
+        cursor_month = post_month(last_created_at)
+        months = [m for m in months if m <= cursor_month]
+        where = "WHERE c.created_at < @last_created_at "
+        cursor.append({"name": "@last_created_at", "value": last_created_at})
+    query = f"SELECT TOP @limit {fields} FROM c {where}ORDER BY c.created_at DESC"
+
+    items = []
+    for month in months:
+        items.extend(
+            posts_container.query_items(
+                query=query,
+                parameters=[{"name": "@limit", "value": limit - len(items)}, *cursor],
+                partition_key=[board_id, month],
+            )
+        )
+        if len(items) >= limit:
+            break
+
+    seen = {it.get("id") for it in items}
+    items.extend(
+        it
+        for it in legacy_posts_container.query_items(
+            query=query,
+            parameters=[{"name": "@limit", "value": limit}, *cursor],
+            partition_key=board_id,
+        )
+        if it.get("id") not in seen
+    )
+    items.sort(key=lambda it: it.get("created_at") or "", reverse=True)
+    return items[:limit]
+
+
+# Bodies smaller than this are sent uncompressed (headers would outweigh savings)
+COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", 1024))
+
+
+def encode_json(data):
+    """Serialize a response payload to UTF-8 JSON bytes."""
+
     # content 필드가 있으면 html.unescape 처리
     def unescape_content(obj):
         if isinstance(obj, dict):
@@ -96,13 +353,56 @@ def response_json(data, status=200):
             return obj
 
     data = unescape_content(data)
-    return (
-        Response(
-            json.dumps(data, ensure_ascii=False),
-            content_type="application/json; charset=utf-8",
-        ),
-        status,
-    )
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _accepted_encoding():
+    accepted = {}
+    for part in request.headers.get("Accept-Encoding", "").split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+def compress_body(body, encoding):
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6)
+
+
+def body_response(body, status=200, variants=None):
+    """Build a JSON response from encoded bytes, compressing if the client accepts it.
+
+    `variants` ({ encoding: bytes }) lets cached payloads keep their compressed
+    forms, so compression runs once per cache fill instead of once per request.
+    """
+    resp = Response(body, content_type="application/json; charset=utf-8")
+    resp.headers["Vary"] = "Accept-Encoding"
+    encoding = _accepted_encoding() if len(body) >= COMPRESS_MIN_BYTES else None
+    if encoding:
+        if variants is None:
+            compressed = compress_body(body, encoding)
+        else:
+            compressed = variants.get(encoding)
+            if compressed is None:
+                compressed = variants[encoding] = compress_body(body, encoding)
+        resp.set_data(compressed)
+        resp.headers["Content-Encoding"] = encoding
+    return resp, status
+
+
+def response_json(data, status=200):
+    return body_response(encode_json(data), status)
 
 
 def time_diff(time_str):
@@ -126,9 +426,137 @@ def get_client_ip():
     return request.remote_addr
 
 
+# -----------------------------
+# Write rate limiting (token bucket per IP)
+# -----------------------------
+
+# "<capacity>/<seconds>": burst of `capacity` writes, refilled evenly over `seconds`.
+# A capacity of 0 disables the limit for that route.
+RATE_LIMIT_DEFAULTS = {
+    "create_post": "3/60",
+    "add_comment": "10/60",
+    "like_post": "30/60",
+}
+# Also enforce buckets in Cosmos so limits hold across Lambda instances
+RATE_LIMIT_SHARED = os.getenv("RATE_LIMIT_SHARED", "").lower() in ("1", "true")
+RATE_LIMIT_MAX_KEYS = 10000
+
+
+def _parse_rate(value, default):
+    try:
+        capacity, period = (value or default).split("/")
+        capacity, period = int(capacity), float(period)
+        if period <= 0:
+            raise ValueError("period must be positive")
+        return capacity, period
+    except ValueError:
+        capacity, period = default.split("/")
+        return int(capacity), float(period)
+
+
+RATE_LIMITS = {
+    route: _parse_rate(os.getenv(f"RATE_LIMIT_{route.upper()}"), default)
+    for route, default in RATE_LIMIT_DEFAULTS.items()
+}
+RATE_BUCKETS = OrderedDict()  # { (route, ip): { 'tokens': float, 'ts': float } }
+rate_limits_container = (
+    _get_or_create_container("rate_limits", "/id", default_ttl=-1)
+    if RATE_LIMIT_SHARED
+    else None
+)
+
+
+def _take_token(bucket, now, capacity, period):
+    """Refill and try to take one token. Returns seconds to wait (0 if allowed)."""
+    rate = capacity / period
+    tokens = min(capacity, bucket["tokens"] + (now - bucket["ts"]) * rate)
+    bucket["ts"] = now
+    if tokens >= 1:
+        bucket["tokens"] = tokens - 1
+        return 0
+    bucket["tokens"] = tokens
+    return (1 - tokens) / rate
+
+
+def _take_shared_token(route, ip, capacity, period):
+    doc_id = f"{route}:{ip}"
+    for _ in range(3):
+        now = time.time()
+        try:
+            doc = rate_limits_container.read_item(item=doc_id, partition_key=doc_id)
+        except exceptions.CosmosResourceNotFoundError:
+            doc = {"id": doc_id, "tokens": capacity, "ts": now, "_etag": None}
+        wait = _take_token(doc, now, capacity, period)
+        if wait:
+            return wait
+        # Expire idle buckets once they would be full again
+        doc["ttl"] = int(period) + 1
+        try:
+            if doc["_etag"] is None:
+                doc.pop("_etag")
+                rate_limits_container.create_item(doc)
+            else:
+                rate_limits_container.replace_item(
+                    item=doc_id, body=doc, if_match=doc["_etag"]
+                )
+            return 0
+        except (
+            exceptions.CosmosAccessConditionFailedError,
+            exceptions.CosmosResourceExistsError,
+        ):
+            continue
+    return 0
+
+
+def _rate_limit_ip():
+    # The first X-Forwarded-For entry is whatever the client sent, so buckets are
+    # keyed on the last hop, which the proxy appended. Without the header, Mangum
+    # passes the API Gateway requestContext source IP through as remote_addr.
+    forwarded = request.headers.get("X-Forwarded-For")
+    if forwarded:
+        return forwarded.split(",")[-1].strip()
+    return request.remote_addr
+
+
+def _rate_limit(route):
+    """Return a 429 response if the client IP has exhausted its bucket, else None."""
+    capacity, period = RATE_LIMITS[route]
+    if capacity <= 0:
+        return None
+    ip = _rate_limit_ip()
+    key = (route, ip)
+    bucket = RATE_BUCKETS.get(key)
+    if bucket is None:
+        bucket = {"tokens": capacity, "ts": time.monotonic()}
+        RATE_BUCKETS[key] = bucket
+        if len(RATE_BUCKETS) > RATE_LIMIT_MAX_KEYS:
+            RATE_BUCKETS.popitem(last=False)
+    else:
+        RATE_BUCKETS.move_to_end(key)
+
+    wait = _take_token(bucket, time.monotonic(), capacity, period)
+    if not wait and rate_limits_container is not None:
+        try:
+            wait = _take_shared_token(route, ip, capacity, period)
+        except Exception as e:
+            # Fail open: the shared store must not take writes down with it
+            print(f"[WARN] Shared rate limit check failed: {e}")
+        if wait:
+            # Denied by the shared bucket: give back the local token
+            bucket["tokens"] = min(capacity, bucket["tokens"] + 1)
+    if not wait:
+        return None
+    resp, status = response_json({"error": "Too many requests"}, 429)
+    resp.headers["Retry-After"] = str(math.ceil(wait))
+    return resp, status
+
+
 # 게시물 작성 API
 @app.route("/boards/<board_id>", methods=["POST"])
 def create_post(board_id):
+    limited = _rate_limit("create_post")
+    if limited:
+        return limited
     data = request.json
     title = (data.get("title") or "").strip()
     content = (data.get("content") or "").strip()
@@ -180,7 +608,38 @@ def create_post(board_id):
     try:
         # Cosmos: posts container, partition by board_id, id = post_id
         post_item = {"id": post_id, **post_data}
+        post_item["month"] = post_month(post_item.get("created_at"))
+        if POSTS_LAYOUT == "monthly":
+            register_board_month(board_id, post_item["month"])
+        previous = None
+        if board_id == "notice":
+            # Notices may be re-posted with the same post_id; replace their weights
+            try:
+                previous = read_post(board_id, post_id)
+            except exceptions.CosmosResourceNotFoundError:
+                previous = None
         posts_container.upsert_item(post_item)
+        if (
+            POSTS_LAYOUT == "monthly"
+            and previous
+            and previous.get("month") != post_item["month"]
+        ):
+            # A new created_at moved the notice to another month partition;
+            # drop the old copy (and its legacy original) so it is listed once
+            for container, pk in (
+                (posts_container, [board_id, previous.get("month")]),
+                (legacy_posts_container, board_id),
+            ):
+                try:
+                    container.delete_item(item=post_id, partition_key=pk)
+                except exceptions.CosmosResourceNotFoundError:
+                    pass
+            _remember_post_month(board_id, post_id, post_item["month"])
+        if post_item["isAccept"]:
+            if previous and previous.get("isAccept"):
+                update_search_index(previous, remove=True)
+            update_search_index(post_item)
+            update_hot_posts(post_item)
         return response_json({"message": "Post created", "post_id": post_id}, 201)
     except Exception as e:
         return response_json({"error": str(e)}, 500)
@@ -197,7 +656,7 @@ def get_posts(board_id):
     last_created_at = last_created_at_param
     if not last_created_at and last:
         try:
-            last_item = posts_container.read_item(item=last, partition_key=board_id)
+            last_item = read_post(board_id, last)
             last_created_at = last_item.get("created_at")
         except exceptions.CosmosResourceNotFoundError:
             last_created_at = None
@@ -221,13 +680,22 @@ def get_posts(board_id):
         )
 
     try:
-        items = list(
-            posts_container.query_items(
-                query=query,
-                parameters=params,
-                partition_key=board_id,
+        if POSTS_LAYOUT == "monthly":
+            items = query_posts_by_month(
+                board_id,
+                "c.id, c.post_id, c.board_id, c.title, c.content, c.tag, c.no, "
+                "c.user_id, c.created_at, c.isAccept, c.likes",
+                limit,
+                last_created_at,
+            )
+        else:
+            items = list(
+                posts_container.query_items(
+                    query=query,
+                    parameters=params,
+                    partition_key=board_id,
+                )
             )
-        )
         posts = []
         last_id = None
         last_created_at_out = None
@@ -249,7 +717,7 @@ def get_posts(board_id):
 @app.route("/boards/<board_id>/<post_id>", methods=["GET"])
 def get_post(board_id, post_id):
     try:
-        item = posts_container.read_item(item=post_id, partition_key=board_id)
+        item = read_post(board_id, post_id)
         # 승인 전 글도 반환하고 프론트에서 마스킹 처리
         return response_json({"posts": [item]})
     except Exception as e:
@@ -258,9 +726,123 @@ def get_post(board_id, post_id):
         return response_json({"error": str(e)}, 500)
 
 
+# -----------------------------
+# Comment thread cache
+# -----------------------------
+
+# Comments are listed oldest-first, so a thread only grows at the tail. Each
+# cached thread is refreshed by fetching only comments at/after the cached tail's
+# created_at; moderation done by other instances is picked up by the periodic
+# full reload (COMMENT_CACHE_MAX_AGE).
+COMMENT_CACHE_POSTS = int(os.getenv("COMMENT_CACHE_POSTS", 256))
+COMMENT_CACHE_MAX_COMMENTS = 1000
+COMMENT_CACHE_TTL = int(os.getenv("COMMENT_CACHE_TTL", 5))
+COMMENT_CACHE_MAX_AGE = int(os.getenv("COMMENT_CACHE_MAX_AGE", 300))
+COMMENT_KEYS = (
+    "id",
+    "comment_id",
+    "post_id",
+    "board_id",
+    "content",
+    "user_id",
+    "created_at",
+    "ip",
+    "isAccept",
+    "isRejected",
+)
+COMMENT_CACHE = OrderedDict()  # { post_id: { 'loaded', 'refreshed', 'items' } }
+
+
+def _query_comment_thread(post_id, since=None):
+    params = [
+        {"name": "@post_id", "value": post_id},
+        {"name": "@limit", "value": COMMENT_CACHE_MAX_COMMENTS + 1},
+    ]
+    where = "c.post_id=@post_id"
+    if since:
+        # >= so comments sharing the tail's timestamp are not missed
+        where += " AND c.created_at >= @since"
+        params.append({"name": "@since", "value": since})
+    fields = ", ".join(f"c.{k}" for k in COMMENT_KEYS)
+    return list(
+        comments_container.query_items(
+            query=f"SELECT TOP @limit {fields} FROM c WHERE {where} "
+            "ORDER BY c.created_at ASC",
+            parameters=params,
+            partition_key=post_id,
+        )
+    )
+
+
+def _cache_comment(entry, comment):
+    """Insert or replace a comment in a cached thread, keeping created_at order."""
+    items = entry["items"]
+    for i in range(len(items) - 1, -1, -1):
+        if items[i]["id"] == comment["id"]:
+            items[i] = comment
+            return
+    idx = len(items)
+    created_at = comment.get("created_at") or ""
+    while idx > 0 and (items[idx - 1].get("created_at") or "") > created_at:
+        idx -= 1
+    items.insert(idx, comment)
+
+
+def _mark_uncacheable(post_id, now):
+    # Negative entry: threads over the size cap use the regular query path until
+    # the entry expires, instead of re-running the fill query on every request
+    COMMENT_CACHE[post_id] = {"loaded": now, "refreshed": now, "items": None}
+    COMMENT_CACHE.move_to_end(post_id)
+    if len(COMMENT_CACHE) > COMMENT_CACHE_POSTS:
+        COMMENT_CACHE.popitem(last=False)
+
+
+def get_comment_thread(post_id):
+    """Return a post's comments oldest-first from the cache, or None if uncacheable."""
+    now = time.monotonic()
+    entry = COMMENT_CACHE.get(post_id)
+    if entry and now - entry["loaded"] > COMMENT_CACHE_MAX_AGE:
+        COMMENT_CACHE.pop(post_id, None)
+        entry = None
+
+    if entry is None:
+        items = _query_comment_thread(post_id)
+        if len(items) > COMMENT_CACHE_MAX_COMMENTS:
+            _mark_uncacheable(post_id, now)
+            return None
+        entry = {"loaded": now, "refreshed": now, "items": items}
+        COMMENT_CACHE[post_id] = entry
+        if len(COMMENT_CACHE) > COMMENT_CACHE_POSTS:
+            COMMENT_CACHE.popitem(last=False)
+        return entry["items"]
+
+    COMMENT_CACHE.move_to_end(post_id)
+    if entry["items"] is None:
+        return None
+    if now - entry["refreshed"] > COMMENT_CACHE_TTL:
+        tail = entry["items"][-1].get("created_at") if entry["items"] else None
+        for comment in _query_comment_thread(post_id, since=tail):
+            _cache_comment(entry, comment)
+        entry["refreshed"] = now
+        if len(entry["items"]) > COMMENT_CACHE_MAX_COMMENTS:
+            _mark_uncacheable(post_id, now)
+            return None
+    return entry["items"]
+
+
+def update_cached_comment(comment):
+    """Apply a new or moderated comment to its cached thread, if cached."""
+    entry = COMMENT_CACHE.get(comment.get("post_id"))
+    if entry is not None and entry["items"] is not None:
+        _cache_comment(entry, {k: comment[k] for k in COMMENT_KEYS if k in comment})
+
+
 # 댓글 작성 API
 @app.route("/boards/<board_id>/<post_id>/comments", methods=["POST"])
 def add_comment(board_id, post_id):
+    limited = _rate_limit("add_comment")
+    if limited:
+        return limited
     data = request.json
     content = (data.get("content") or "").strip()
     user_id = (data.get("user_id") or "").strip()
@@ -288,6 +870,7 @@ def add_comment(board_id, post_id):
     try:
         comment_item = {"id": comment_id, **comment_data}
         comments_container.upsert_item(comment_item)
+        update_cached_comment(comment_item)
         return response_json(
             {"message": "Comment added", "comment_id": comment_id}, 201
         )
@@ -301,6 +884,28 @@ def get_comments(board_id, post_id):
     limit = 10
     last_comment_id = request.args.get("last_comment_id")
 
+    # Serve from the cached thread when the cursor is inside it
+    try:
+        thread = get_comment_thread(post_id)
+    except Exception:
+        # e.g. ORDER BY not supported by the index; use the query path below
+        thread = None
+    if thread is not None:
+        start = 0
+        if last_comment_id:
+            start = next(
+                (i + 1 for i, c in enumerate(thread) if c["id"] == last_comment_id),
+                None,
+            )
+        if start is not None:
+            page = thread[start : start + limit]
+            return response_json(
+                {
+                    "comments": page,
+                    "last_comment_id": page[-1]["id"] if page else None,
+                }
+            )
+
     # Empty collection quick check via count of top 1
     # 승인 여부와 관계없이 모두 반환 (프론트에서 마스킹)
     last_created_at = None
@@ -404,7 +1009,7 @@ def apply_like_once(post_id, board_id, ip):
     """
     # 1) Ensure post exists
     try:
-        post_item = posts_container.read_item(item=post_id, partition_key=board_id)
+        post_item = read_post(board_id, post_id)
     except exceptions.CosmosResourceNotFoundError:
         return {"status": "not_found", "likes": None}
 
@@ -429,7 +1034,7 @@ def apply_like_once(post_id, board_id, ip):
     for _ in range(5):
         try:
             # refresh
-            post_item = posts_container.read_item(item=post_id, partition_key=board_id)
+            post_item = read_post(board_id, post_id)
             etag = post_item.get("_etag")
             post_item["likes"] = (post_item.get("likes") or 0) + 1
             posts_container.replace_item(
@@ -437,31 +1042,123 @@ def apply_like_once(post_id, board_id, ip):
                 body=post_item,
                 if_match=etag,
             )
+            update_hot_posts(post_item)
             return {"status": "ok", "likes": post_item.get("likes", 0)}
         except exceptions.CosmosAccessConditionFailedError:
             continue
     # If we failed to increment due to contention, just return current count
-    post_item = posts_container.read_item(item=post_id, partition_key=board_id)
+    post_item = read_post(board_id, post_id)
     return {"status": "ok", "likes": post_item.get("likes") or 0}
 
 
+# -----------------------------
+# Duplicate-like filter
+# -----------------------------
+
+# Per-post Bloom filters of IPs that already liked, kept in an LRU of posts.
+# A filter hit is confirmed with a point read of the like record (id=ip), which is
+# far cheaper than the post reads and failing create_item of the full path; on a
+# false positive the request simply continues to apply_like_once.
+LIKE_FILTER_POSTS = int(os.getenv("LIKE_FILTER_POSTS", 512))
+LIKE_FILTER_BITS = int(os.getenv("LIKE_FILTER_BITS", 65536))
+LIKE_FILTER_HASHES = 4
+# Also consult the shared likes container on a local miss (catches repeats that
+# another Lambda instance saw first, at the cost of one point read per like)
+LIKE_FILTER_SHARED = os.getenv("LIKE_FILTER_SHARED", "").lower() in ("1", "true")
+
+LIKE_FILTERS = OrderedDict()  # { 'board_id/post_id': { 'bits', 'likes' } }
+LIKE_FILTER_STATS = {
+    "checks": 0,
+    "hits": 0,
+    "shared_hits": 0,
+    "false_positives": 0,
+}
+
+
+def _like_filter_positions(ip):
+    digest = hashlib.blake2b(ip.encode("utf-8"), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    return [(h1 + i * h2) % LIKE_FILTER_BITS for i in range(LIKE_FILTER_HASHES)]
+
+
+def like_filter_add(board_id, post_id, ip, likes):
+    """Remember that ip has liked the post, along with the latest like count."""
+    key = f"{board_id}/{post_id}"
+    entry = LIKE_FILTERS.get(key)
+    if entry is None:
+        entry = {"bits": bytearray(LIKE_FILTER_BITS // 8), "likes": None}
+        LIKE_FILTERS[key] = entry
+        if len(LIKE_FILTERS) > LIKE_FILTER_POSTS:
+            LIKE_FILTERS.popitem(last=False)
+    else:
+        LIKE_FILTERS.move_to_end(key)
+    for pos in _like_filter_positions(ip):
+        entry["bits"][pos >> 3] |= 1 << (pos & 7)
+    if likes is not None:
+        entry["likes"] = likes
+
+
+def like_filter_check(board_id, post_id, ip):
+    """Return (already_liked, last_known_likes) for a like request.
+
+    Only answers True once Cosmos has confirmed the like record exists.
+    """
+    LIKE_FILTER_STATS["checks"] += 1
+    entry = LIKE_FILTERS.get(f"{board_id}/{post_id}")
+    maybe = entry is not None and all(
+        entry["bits"][pos >> 3] & (1 << (pos & 7)) for pos in _like_filter_positions(ip)
+    )
+    if not maybe and not LIKE_FILTER_SHARED:
+        return False, None
+    try:
+        likes_container.read_item(item=ip, partition_key=post_id)
+    except exceptions.CosmosResourceNotFoundError:
+        if maybe:
+            LIKE_FILTER_STATS["false_positives"] += 1
+        return False, None
+    if maybe:
+        LIKE_FILTER_STATS["hits"] += 1
+        return True, entry["likes"]
+    LIKE_FILTER_STATS["shared_hits"] += 1
+    return True, None
+
+
 # 게시물 좋아요 API
 @app.route("/boards/<board_id>/<post_id>/like", methods=["POST"])
 def like_post(board_id, post_id):
+    limited = _rate_limit("like_post")
+    if limited:
+        return limited
     try:
+        ip = get_client_ip()
+        # 이미 추천한 IP는 게시물 조회 없이 바로 응답
+        already, likes = like_filter_check(board_id, post_id, ip)
+        if already:
+            if likes is None:
+                try:
+                    post_item = read_post(board_id, post_id)
+                except exceptions.CosmosResourceNotFoundError:
+                    return response_json({"error": "Post not found"}, 404)
+                likes = post_item.get("likes") or 0
+                like_filter_add(board_id, post_id, ip, likes)
+            return response_json(
+                {"post_id": post_id, "likes": likes, "already_liked": True}
+            )
+
         # 승인된 글만 추천 가능 (공지 제외)
         try:
-            post_item = posts_container.read_item(item=post_id, partition_key=board_id)
+            post_item = read_post(board_id, post_id)
         except exceptions.CosmosResourceNotFoundError:
             return response_json({"error": "Post not found"}, 404)
 
         if board_id != "notice" and not (post_item.get("isAccept")):
             return response_json({"error": "Not acceptable"}, 403)
 
-        ip = get_client_ip()
         result = apply_like_once(post_id, board_id, ip)
         if result["status"] == "not_found":
             return response_json({"error": "Post not found"}, 404)
+        like_filter_add(board_id, post_id, ip, result["likes"])
 
         return response_json(
             {
@@ -474,6 +1171,778 @@ def like_post(board_id, post_id):
         return response_json({"error": str(e)}, 500)
 
 
+# -----------------------------
+# Hot posts ranking
+# -----------------------------
+
+# Reddit-style score: log2(1 + likes) + created_at / HOT_DECAY_SECONDS. Newer posts
+# carry a larger time term, so relative order never changes as time passes and
+# the per-board top-K only needs updating when a post is liked or published.
+HOT_K = int(os.getenv("HOT_K", 50))
+HOT_DECAY_SECONDS = int(os.getenv("HOT_DECAY_SECONDS", 45000))
+HOT_CACHE_TTL = int(os.getenv("HOT_CACHE_TTL", 30))
+HOT_CACHE_BOARDS = int(os.getenv("HOT_CACHE_BOARDS", 256))
+HOT_FIELDS = (
+    "id",
+    "post_id",
+    "board_id",
+    "title",
+    "tag",
+    "no",
+    "user_id",
+    "created_at",
+    "likes",
+)
+
+# In-memory copy of recently requested boards' snapshot documents (LRU; board
+# ids come from the URL, so the cache must not grow with every id requested)
+HOT_CACHE = OrderedDict()  # { board_id: { 'ts': datetime, 'items': [entries] } }
+
+
+def _hot_doc_id(board_id):
+    # Stored next to the board's post counter (same partition)
+    return f"hot:{board_id}"
+
+
+def _cache_hot(board_id, items):
+    HOT_CACHE[board_id] = {"ts": datetime.now(timezone.utc), "items": items}
+    HOT_CACHE.move_to_end(board_id)
+    if len(HOT_CACHE) > HOT_CACHE_BOARDS:
+        HOT_CACHE.popitem(last=False)
+
+
+def hot_score(post_item):
+    try:
+        created = datetime.fromisoformat(
+            (post_item.get("created_at") or "").replace("Z", "+00:00")
+        )
+        if created.tzinfo is None:
+            created = created.replace(tzinfo=timezone.utc)
+    except ValueError:
+        created = datetime.now(timezone.utc)
+    likes = post_item.get("likes") or 0
+    return math.log2(1 + likes) + created.timestamp() / HOT_DECAY_SECONDS
+
+
+def update_hot_posts(post_item, remove=False):
+    """Insert/refresh (or drop) a post in its board's top-K snapshot.
+
+    Best-effort: failures are logged and never fail the calling request.
+    """
+    board_id = post_item.get("board_id")
+    post_id = str(post_item.get("post_id") or post_item.get("id"))
+    doc_id = _hot_doc_id(board_id)
+    try:
+        for _ in range(5):
+            try:
+                doc = counters_container.read_item(item=doc_id, partition_key=board_id)
+            except exceptions.CosmosResourceNotFoundError:
+                doc = None
+            items = [
+                it for it in (doc or {}).get("items", []) if it["post_id"] != post_id
+            ]
+            if not remove:
+                entry = {k: post_item.get(k) for k in HOT_FIELDS}
+                entry["id"] = entry["id"] or post_id
+                entry["hot"] = hot_score(post_item)
+                items.append(entry)
+            items = heapq.nlargest(HOT_K, items, key=lambda it: it["hot"])
+            if doc is not None and items == doc.get("items"):
+                # Post did not make (and was not in) the top-K; nothing to write
+                break
+            try:
+                if doc is None:
+                    counters_container.create_item(
+                        {"id": doc_id, "board_id": board_id, "items": items}
+                    )
+                else:
+                    doc["items"] = items
+                    counters_container.replace_item(
+                        item=doc_id, body=doc, if_match=doc.get("_etag")
+                    )
+                _cache_hot(board_id, items)
+                break
+            except (
+                exceptions.CosmosAccessConditionFailedError,
+                exceptions.CosmosResourceExistsError,
+            ):
+                continue
+    except Exception as e:
+        print(f"[WARN] Failed to update hot posts: {e}")
+
+
+def get_hot_snapshot(board_id):
+    cache_entry = HOT_CACHE.get(board_id)
+    if cache_entry:
+        age = (datetime.now(timezone.utc) - cache_entry["ts"]).total_seconds()
+        if age < HOT_CACHE_TTL:
+            HOT_CACHE.move_to_end(board_id)
+            return cache_entry["items"]
+    try:
+        doc = counters_container.read_item(
+            item=_hot_doc_id(board_id), partition_key=board_id
+        )
+        items = doc.get("items") or []
+    except exceptions.CosmosResourceNotFoundError:
+        items = []
+    _cache_hot(board_id, items)
+    return items
+
+
+def rebuild_hot_posts(board_id):
+    """Recompute a board's top-K snapshot from all accepted posts."""
+    items = []
+    for post_item in query_board_posts(
+        board_id, "SELECT * FROM c WHERE c.isAccept=true"
+    ):
+        entry = {k: post_item.get(k) for k in HOT_FIELDS}
+        entry["id"] = entry["id"] or str(post_item.get("post_id"))
+        entry["hot"] = hot_score(post_item)
+        items.append(entry)
+        # Keep memory bounded while scanning large boards
+        if len(items) > HOT_K * 4:
+            items = heapq.nlargest(HOT_K, items, key=lambda it: it["hot"])
+    items = heapq.nlargest(HOT_K, items, key=lambda it: it["hot"])
+    counters_container.upsert_item(
+        {"id": _hot_doc_id(board_id), "board_id": board_id, "items": items}
+    )
+    _cache_hot(board_id, items)
+    return items
+
+
+@app.cli.command("hot-rebuild")
+@click.argument("board_id")
+def hot_rebuild_command(board_id):
+    """Recompute a board's hot posts snapshot from scratch."""
+    items = rebuild_hot_posts(board_id)
+    click.echo(f"Stored {len(items)} hot posts")
+
+
+# 인기 게시물 조회 API
+@app.route("/boards/<board_id>/hot", methods=["GET"])
+def get_hot_posts(board_id):
+    try:
+        get_hot_snapshot(board_id)
+        cache_entry = HOT_CACHE[board_id]
+        if "body" not in cache_entry:
+            cache_entry["body"] = encode_json({"posts": cache_entry["items"]})
+            cache_entry["variants"] = {}
+        return body_response(cache_entry["body"], variants=cache_entry["variants"])
+    except Exception as e:
+        return response_json({"error": str(e)}, 500)
+
+
+# -----------------------------
+# Search index (character n-grams)
+# -----------------------------
+
+# Posts/comments are indexed as character bigrams so Korean text can be searched
+# without a morphological analyzer. Each (board, gram) has one posting document
+# { post_id: weighted tf }; accepted comments add their weight to their post.
+SEARCH_NGRAM = 2
+SEARCH_TITLE_WEIGHT = 3
+# Grams found in more posts than this become stop grams: their postings are
+# dropped (they carry almost no ranking signal). Every write reads and replaces
+# whole posting documents, so this also caps the cost of indexing one post.
+SEARCH_MAX_POSTINGS = int(os.getenv("SEARCH_MAX_POSTINGS", 1000))
+SEARCH_WRITE_WORKERS = 8
+_SEARCH_TAG_RE = re.compile(r"<[^>]+>")
+_SEARCH_SPLIT_RE = re.compile(r"[\W_]+")
+
+
+def search_grams(text):
+    """Normalize text and split it into character n-grams."""
+    text = html.unescape(_SEARCH_TAG_RE.sub(" ", text or ""))
+    text = unicodedata.normalize("NFC", text).lower()
+    grams = []
+    for token in _SEARCH_SPLIT_RE.split(text):
+        if len(token) <= SEARCH_NGRAM:
+            if token:
+                grams.append(token)
+            continue
+        grams.extend(
+            token[i : i + SEARCH_NGRAM] for i in range(len(token) - SEARCH_NGRAM + 1)
+        )
+    return grams
+
+
+def _search_doc_id(board_id, gram):
+    # Grams only contain word characters, so they are always valid in an id
+    return f"{board_id}:{gram}"
+
+
+def _search_post_id(doc):
+    return str(doc.get("post_id") or doc.get("id"))
+
+
+def _search_terms(doc):
+    terms = {}
+    for gram in search_grams(doc.get("title")):
+        terms[gram] = terms.get(gram, 0) + SEARCH_TITLE_WEIGHT
+    for gram in search_grams(doc.get("content")):
+        terms[gram] = terms.get(gram, 0) + 1
+    return terms
+
+
+def _apply_posting(board_id, gram, post_id, delta):
+    """Add delta to a post's weight in one gram's posting document with ETag retry."""
+    doc_id = _search_doc_id(board_id, gram)
+    for _ in range(5):
+        try:
+            doc = search_container.read_item(item=doc_id, partition_key=board_id)
+        except exceptions.CosmosResourceNotFoundError:
+            if delta < 0:
+                return
+            doc = None
+        if doc is not None and doc.get("stop"):
+            return
+        body = doc or {"id": doc_id, "board_id": board_id, "gram": gram}
+        postings = body.get("postings") or {}
+        tf = postings.get(post_id, 0) + delta
+        if tf > 0:
+            postings[post_id] = tf
+        else:
+            postings.pop(post_id, None)
+        body["postings"] = postings
+        if len(postings) > SEARCH_MAX_POSTINGS:
+            body["stop"] = True
+            body["postings"] = {}
+        try:
+            if doc is None:
+                search_container.create_item(body)
+            else:
+                search_container.replace_item(
+                    item=doc_id, body=body, if_match=doc.get("_etag")
+                )
+            return
+        except (
+            exceptions.CosmosAccessConditionFailedError,
+            exceptions.CosmosResourceExistsError,
+        ):
+            # Concurrent update of the same gram, retry
+            continue
+    raise RuntimeError(f"Failed to update search postings for '{gram}'")
+
+
+def update_search_index(doc, remove=False):
+    """Add (or subtract) an accepted post's or comment's weights in the index.
+
+    Weights are additive, so callers only report acceptance state changes.
+    Failures are logged only; `flask search-rebuild <board_id>` repairs drift.
+    """
+    board_id = doc.get("board_id")
+    if not board_id:
+        return
+    post_id = _search_post_id(doc)
+    sign = -1 if remove else 1
+    try:
+        with ThreadPoolExecutor(max_workers=SEARCH_WRITE_WORKERS) as pool:
+            futures = [
+                pool.submit(_apply_posting, board_id, gram, post_id, sign * tf)
+                for gram, tf in _search_terms(doc).items()
+            ]
+            for future in futures:
+                future.result()
+    except Exception as e:
+        print(f"[WARN] Failed to update search index: {e}")
+
+
+def search_board(board_id, query):
+    """Rank posts of a board against a query.
+
+    Returns a list of (post_id, score) ordered by matched n-gram count, then score.
+    """
+    grams = sorted(set(search_grams(query)))
+    if not grams:
+        return []
+
+    per_gram = {}  # gram -> { post_id: tf }
+    stop_grams = 0
+    for gram in grams:
+        try:
+            doc = search_container.read_item(
+                item=_search_doc_id(board_id, gram), partition_key=board_id
+            )
+        except exceptions.CosmosResourceNotFoundError:
+            continue
+        if doc.get("stop"):
+            stop_grams += 1
+        elif doc.get("postings"):
+            per_gram[gram] = doc["postings"]
+
+    candidates = set()
+    for per_post in per_gram.values():
+        candidates.update(per_post)
+    total = len(candidates)
+
+    matched = {}
+    scores = {}
+    for per_post in per_gram.values():
+        idf = math.log(1 + total / len(per_post))
+        for post_id, tf in per_post.items():
+            matched[post_id] = matched.get(post_id, 0) + 1
+            scores[post_id] = scores.get(post_id, 0.0) + idf * tf / (tf + 1.2)
+
+    # Drop candidates that share only a small fraction of the query's n-grams
+    min_matched = (len(grams) - stop_grams + 1) // 2
+
+    def _rank(post_id):
+        no = int(post_id) if post_id.isdigit() else 0
+        return (-matched[post_id], -scores[post_id], -no)
+
+    ranked = [pid for pid in candidates if matched[pid] >= min_matched]
+    ranked.sort(key=_rank)
+    return [(pid, scores[pid]) for pid in ranked]
+
+
+def _accepted_post_ids(board_id, post_ids):
+    """Return the subset of post_ids that exist and are accepted."""
+    accepted = set()
+    for i in range(0, len(post_ids), POSTS_ID_BATCH):
+        accepted.update(
+            it["id"]
+            for it in query_board_posts(
+                board_id,
+                "SELECT c.id FROM c "
+                "WHERE ARRAY_CONTAINS(@ids, c.id) AND c.isAccept=true",
+                [{"name": "@ids", "value": post_ids[i : i + POSTS_ID_BATCH]}],
+            )
+        )
+    return accepted
+
+
+# 게시물 검색 API
+@app.route("/boards/<board_id>/search", methods=["GET"])
+def search_posts(board_id):
+    limit = 10
+    q = (request.args.get("q") or "").strip()
+    if not q:
+        return response_json({"error": "Missing query"}, 400)
+    try:
+        offset = max(0, int(request.args.get("offset") or 0))
+    except ValueError:
+        offset = 0
+
+    try:
+        ranked = search_board(board_id, q)
+        # The index may still hold deleted or rejected posts; drop them before
+        # paging so pages stay full and `total` matches what can be listed
+        accepted = _accepted_post_ids(board_id, [pid for pid, _ in ranked])
+        ranked = [(pid, score) for pid, score in ranked if pid in accepted]
+        page = ranked[offset : offset + limit]
+        posts = []
+        if page:
+            items = query_board_posts(
+                board_id,
+                "SELECT c.id, c.post_id, c.board_id, c.title, c.content, c.tag, c.no, c.user_id, "
+                "c.created_at, c.isAccept, c.likes "
+                "FROM c WHERE ARRAY_CONTAINS(@ids, c.id) AND c.isAccept=true",
+                [{"name": "@ids", "value": [pid for pid, _ in page]}],
+            )
+            by_id = {it.get("id"): it for it in items}
+            for post_id, score in page:
+                it = by_id.get(post_id)
+                if it:
+                    it["score"] = round(score, 4)
+                    posts.append(it)
+        next_offset = offset + limit if offset + limit < len(ranked) else None
+        return response_json(
+            {"posts": posts, "total": len(ranked), "next": next_offset}
+        )
+    except Exception as e:
+        return response_json({"error": str(e)}, 500)
+
+
+def rebuild_search_index(board_id):
+    """Rebuild a board's search index from accepted posts and comments.
+
+    Returns (posts, comments, grams, stop_grams, removed) counts.
+    """
+    index = {}  # gram -> { post_id: tf }
+
+    def _index(doc):
+        post_id = _search_post_id(doc)
+        for gram, tf in _search_terms(doc).items():
+            postings = index.setdefault(gram, {})
+            postings[post_id] = postings.get(post_id, 0) + tf
+
+    posts = 0
+    for doc in query_board_posts(board_id, "SELECT * FROM c WHERE c.isAccept=true"):
+        _index(doc)
+        posts += 1
+    comments = 0
+    for doc in comments_container.query_items(
+        query="SELECT * FROM c WHERE c.board_id=@board_id AND c.isAccept=true",
+        parameters=[{"name": "@board_id", "value": board_id}],
+        enable_cross_partition_query=True,
+    ):
+        _index(doc)
+        comments += 1
+
+    docs = []
+    for gram, postings in index.items():
+        stop = len(postings) > SEARCH_MAX_POSTINGS
+        docs.append(
+            {
+                "id": _search_doc_id(board_id, gram),
+                "board_id": board_id,
+                "gram": gram,
+                "postings": {} if stop else postings,
+                "stop": stop,
+            }
+        )
+    live = {doc["id"] for doc in docs}
+    with ThreadPoolExecutor(max_workers=SEARCH_WRITE_WORKERS) as pool:
+        list(pool.map(search_container.upsert_item, docs))
+        # Drop posting documents of grams that no longer occur on the board
+        stale = [
+            it["id"]
+            for it in search_container.query_items(
+                query="SELECT c.id FROM c", partition_key=board_id
+            )
+            if it["id"] not in live
+        ]
+        list(
+            pool.map(
+                lambda doc_id: search_container.delete_item(
+                    item=doc_id, partition_key=board_id
+                ),
+                stale,
+            )
+        )
+    stop_grams = sum(doc["stop"] for doc in docs)
+    return posts, comments, len(docs), stop_grams, len(stale)
+
+
+@app.cli.command("search-rebuild")
+@click.argument("board_id")
+def search_rebuild_command(board_id):
+    """Rebuild a board's search index from accepted posts and comments."""
+    posts, comments, grams, stop_grams, removed = rebuild_search_index(board_id)
+    click.echo(
+        f"Indexed {posts} posts and {comments} comments into {grams} grams "
+        f"({stop_grams} stop grams, {removed} removed)"
+    )
+
+
+@app.cli.command("search-bench")
+@click.argument("board_id")
+@click.argument("query")
+@click.option("--runs", default=20, show_default=True)
+def search_bench_command(board_id, query, runs):
+    """Compare index lookups against CONTAINS() scans on a live board."""
+    scan_query = (
+        "SELECT c.id FROM c WHERE c.isAccept=true "
+        "AND (CONTAINS(c.title, @q, true) OR CONTAINS(c.content, @q, true))"
+    )
+
+    def _scan():
+        return list(
+            posts_container.query_items(
+                query=scan_query,
+                parameters=[{"name": "@q", "value": query}],
+                partition_key=posts_pk(board_id),
+            )
+        )
+
+    def _index():
+        return search_board(board_id, query)
+
+    for name, fn in (("index", _index), ("scan", _scan)):
+        fn()  # warm up connections
+        started = time.perf_counter()
+        for _ in range(runs):
+            hits = len(fn())
+        elapsed = (time.perf_counter() - started) / runs * 1000
+        click.echo(f"{name:>5}: {elapsed:8.2f} ms/query, {hits} hits")
+
+
+@app.cli.command("likes-ttl")
+def likes_ttl_command():
+    """Apply LIKES_TTL_DAYS to the existing likes container (0 disables expiry)."""
+    database.replace_container(
+        likes_container,
+        partition_key=PartitionKey(path="/post_id"),
+        default_ttl=LIKES_TTL_DAYS * 86400 or None,
+    )
+    if LIKES_TTL_DAYS:
+        click.echo(f"Likes now expire after {LIKES_TTL_DAYS} days")
+    else:
+        click.echo("Likes no longer expire")
+
+
+@app.cli.command("posts-migrate")
+@click.argument("board_id", required=False)
+def posts_migrate_command(board_id):
+    """Copy posts into the monthly layout (idempotent; safe while serving).
+
+    Run after deploying POSTS_LAYOUT=monthly; until then, single posts are
+    copied on first read and listings and scans also read the legacy container.
+    """
+    if POSTS_LAYOUT != "monthly":
+        raise click.UsageError("Set POSTS_LAYOUT=monthly before migrating")
+
+    if board_id:
+        items = legacy_posts_container.query_items(
+            query="SELECT * FROM c", partition_key=board_id
+        )
+    else:
+        items = legacy_posts_container.query_items(
+            query="SELECT * FROM c", enable_cross_partition_query=True
+        )
+    copied = skipped = 0
+    for item in items:
+        _, created = migrate_post(item)
+        if created:
+            copied += 1
+        else:
+            skipped += 1
+    click.echo(f"Migrated {copied} posts ({skipped} already present)")
+
+
+# -----------------------------
+# Bulk export / import
+# -----------------------------
+
+# Export format: one {"type": ..., "doc": {...}} JSON object per line (NDJSON),
+# gzip-compressed. Types: counter, post, comment, like.
+EXPORT_PAGE_SIZE = 1000
+IMPORT_BATCH_SIZE = 100  # transactional batch limit per partition key
+IMPORT_MAX_RETRIES = 8
+
+
+def export_board_docs(board_id):
+    """Yield (type, doc) for every document of a board, page by page.
+
+    Pages are fetched lazily via Cosmos continuation tokens, so memory use does
+    not grow with board size.
+    """
+    params = [{"name": "@board_id", "value": board_id}]
+    sources = (
+        (
+            "counter",
+            counters_container,
+            "SELECT * FROM c WHERE c.id=@board_id",
+            {"partition_key": board_id},
+        ),
+        (
+            "post",
+            posts_container,
+            "SELECT * FROM c WHERE c.board_id=@board_id",
+            {"partition_key": posts_pk(board_id)},
+        ),
+        (
+            "comment",
+            comments_container,
+            "SELECT * FROM c WHERE c.board_id=@board_id",
+            {"enable_cross_partition_query": True},
+        ),
+        (
+            "like",
+            likes_container,
+            "SELECT * FROM c WHERE c.board_id=@board_id",
+            {"enable_cross_partition_query": True},
+        ),
+    )
+    for kind, container, query, options in sources:
+        pages = container.query_items(
+            query=query,
+            parameters=params,
+            max_item_count=EXPORT_PAGE_SIZE,
+            **options,
+        ).by_page()
+        for page in pages:
+            for doc in page:
+                yield kind, {
+                    k: v for k, v in doc.items() if k not in _COSMOS_SYSTEM_FIELDS
+                }
+
+
+def export_ndjson(docs):
+    for kind, doc in docs:
+        line = json.dumps({"type": kind, "doc": doc}, ensure_ascii=False)
+        yield (line + "\n").encode("utf-8")
+
+
+def gzip_stream(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _with_backoff(fn, *args, **kwargs):
+    """Call fn, sleeping for the server-suggested interval on 429 (RU exhausted)."""
+    for attempt in range(IMPORT_MAX_RETRIES):
+        try:
+            return fn(*args, **kwargs)
+        except exceptions.CosmosHttpResponseError as e:
+            if e.status_code != 429 or attempt == IMPORT_MAX_RETRIES - 1:
+                raise
+            retry_ms = (e.headers or {}).get("x-ms-retry-after-ms")
+            time.sleep(float(retry_ms) / 1000 if retry_ms else 0.1 * 2**attempt)
+
+
+def _import_target(kind, doc):
+    """Container and partition key value a record is written to."""
+    if kind == "post":
+        if POSTS_LAYOUT == "monthly":
+            doc["month"] = post_month(doc.get("created_at"))
+            register_board_month(doc["board_id"], doc["month"])
+            return posts_container, [doc["board_id"], doc["month"]]
+        return posts_container, doc["board_id"]
+    if kind == "comment":
+        return comments_container, doc["post_id"]
+    if kind == "like":
+        return likes_container, doc["post_id"]
+    if kind == "counter":
+        return counters_container, doc["board_id"]
+    raise ValueError(f"Unknown record type: {kind}")
+
+
+def _write_batch(container, partition_key, docs):
+    operations = [("upsert", (doc,)) for doc in docs]
+    _with_backoff(
+        container.execute_item_batch,
+        batch_operations=operations,
+        partition_key=partition_key,
+    )
+
+
+def import_records(pool, records):
+    """Upsert records in parallel, grouped into per-partition batches."""
+    batches = {}
+    for record in records:
+        container, pk = _import_target(record["type"], record["doc"])
+        key = (record["type"], tuple(pk) if isinstance(pk, list) else pk)
+        batches.setdefault(key, (container, pk, []))[2].append(record["doc"])
+    futures = []
+    for container, pk, docs in batches.values():
+        for i in range(0, len(docs), IMPORT_BATCH_SIZE):
+            futures.append(
+                pool.submit(
+                    _write_batch, container, pk, docs[i : i + IMPORT_BATCH_SIZE]
+                )
+            )
+    for future in futures:
+        future.result()
+
+
+@app.cli.command("board-export")
+@click.argument("board_id")
+@click.argument("path", type=click.Path(dir_okay=False, writable=True))
+def board_export_command(board_id, path):
+    """Stream a board's posts, comments and likes to gzip NDJSON."""
+    count = 0
+
+    def _counted():
+        nonlocal count
+        for record in export_board_docs(board_id):
+            count += 1
+            yield record
+
+    started = time.perf_counter()
+    with open(path, "wb") as f:
+        for chunk in gzip_stream(export_ndjson(_counted())):
+            f.write(chunk)
+    elapsed = max(time.perf_counter() - started, 0.001)
+    click.echo(
+        f"Exported {count} documents in {elapsed:.1f}s ({count / elapsed:.0f}/s)"
+    )
+
+
+@app.cli.command("board-import")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--workers", default=8, show_default=True)
+@click.option("--window", default=5000, show_default=True, help="Lines per checkpoint")
+@click.option("--checkpoint", help="Checkpoint file (default: PATH.checkpoint)")
+def board_import_command(path, workers, window, checkpoint):
+    """Import an NDJSON(.gz) export; re-running resumes after the last checkpoint."""
+    checkpoint = checkpoint or f"{path}.checkpoint"
+    done = 0
+    if os.path.exists(checkpoint):
+        with open(checkpoint, "r", encoding="utf-8") as f:
+            done = int(f.read().strip() or 0)
+        click.echo(f"Resuming after line {done}")
+
+    def _flush(pool, records, line_no):
+        import_records(pool, records)
+        # Upserts are idempotent, so replaying a partially written window is safe
+        with open(checkpoint, "w", encoding="utf-8") as f:
+            f.write(str(line_no))
+
+    opener = gzip.open if path.endswith(".gz") else open
+    started = time.perf_counter()
+    written = 0
+    line_no = 0
+    boards = set()
+    with opener(path, "rt", encoding="utf-8") as f, ThreadPoolExecutor(
+        max_workers=workers
+    ) as pool:
+        records = []
+        for line in f:
+            line_no += 1
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            boards.add(record["doc"].get("board_id"))
+            if line_no <= done:
+                continue
+            records.append(record)
+            if len(records) >= window:
+                _flush(pool, records, line_no)
+                written += len(records)
+                records = []
+                rate = written / max(time.perf_counter() - started, 0.001)
+                click.echo(f"{written} documents ({rate:.0f}/s)")
+        if records:
+            _flush(pool, records, line_no)
+            written += len(records)
+
+    elapsed = max(time.perf_counter() - started, 0.001)
+    click.echo(
+        f"Imported {written} documents in {elapsed:.1f}s ({written / elapsed:.0f}/s)"
+    )
+
+    # Derived data is not part of the export; rebuild it for every imported board
+    for board_id in sorted(b for b in boards if b):
+        posts, comments, grams, _, _ = rebuild_search_index(board_id)
+        hot = rebuild_hot_posts(board_id)
+        click.echo(
+            f"{board_id}: indexed {posts} posts and {comments} comments "
+            f"({grams} grams), {len(hot)} hot posts"
+        )
+    if os.path.exists(checkpoint):
+        os.remove(checkpoint)
+
+
+@app.cli.command("compression-bench")
+@click.argument("paths", nargs=-1, required=True)
+@click.option("--runs", default=50, show_default=True)
+@click.option("--mbps", default=2.0, show_default=True, help="Client bandwidth")
+def compression_bench_command(paths, runs, mbps):
+    """Compare response bytes and time for GET paths per Accept-Encoding."""
+    client = app.test_client()
+    encodings = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+    for path in paths:
+        click.echo(path)
+        for encoding in encodings:
+            headers = {"Accept-Encoding": encoding}
+            client.get(path, headers=headers)  # warm caches
+            started = time.perf_counter()
+            for _ in range(runs):
+                resp = client.get(path, headers=headers)
+            server_ms = (time.perf_counter() - started) / runs * 1000
+            size = len(resp.get_data())
+            transfer_ms = size * 8 / (mbps * 1000)
+            click.echo(
+                f"  {encoding:>8}: {size:8d} bytes, {server_ms:7.2f} ms server, "
+                f"{transfer_ms:8.2f} ms transfer @ {mbps} Mbps"
+            )
+
+
 def update_env_file(key, value, file_path=".env"):
     """Update environment variable.
 
@@ -571,6 +2040,23 @@ def update_laundry_token():
 LAUNDRY_CACHE = {}  # { code: { 'ts': datetime.utcnow(), 'data': [dryers] } }
 
 
+def _laundry_response(cache_entry):
+    # time_diff changes every second, so the encoded (and compressed) body is
+    # reused for all requests within the same second
+    second = int(datetime.now(timezone.utc).timestamp())
+    rendered = cache_entry.get("rendered")
+    if not rendered or rendered["second"] != second:
+        # Recompute time_diff to keep it current without hitting upstream
+        dryers = []
+        for d in cache_entry["data"] or []:
+            dd = dict(d)
+            dd["time_diff"] = time_diff(d.get("useEndTime"))
+            dryers.append(dd)
+        rendered = {"second": second, "body": encode_json(dryers), "variants": {}}
+        cache_entry["rendered"] = rendered
+    return body_response(rendered["body"], variants=rendered["variants"])
+
+
 # 건조기 현황 조회 API
 @app.route("/laundry/<sex>", methods=["GET"])
 def get_laundry(sex):
@@ -588,14 +2074,7 @@ def get_laundry(sex):
         age = (datetime.now(timezone.utc) - cache_entry["ts"]).total_seconds()
         ttl = int(os.getenv("LAUNDRY_CACHE_TTL", 60))
         if age < ttl:
-            cached = cache_entry["data"] or []
-            # Recompute time_diff to keep it current without hitting upstream
-            dryers = []
-            for d in cached:
-                dd = dict(d)
-                dd["time_diff"] = time_diff(d.get("useEndTime"))
-                dryers.append(dd)
-            return response_json(dryers)
+            return _laundry_response(cache_entry)
 
     token = os.getenv("LAUNDRY_AUTH")
     laundry_api = f"{os.getenv('LAUNDRY_API')}/laundry/new/list"
@@ -643,7 +2122,7 @@ def get_laundry(sex):
             )
         # Cache fresh result
         LAUNDRY_CACHE[code] = {"ts": datetime.now(timezone.utc), "data": dryers}
-        return response_json(dryers)
+        return _laundry_response(LAUNDRY_CACHE[code])
     except requests.RequestException as e:
         return response_json({"error": "Request failed", "detail": str(e)}, 502)
 
@@ -676,9 +2155,10 @@ def admin_accept_post(board_id, post_id):
         accept = True
     try:
         try:
-            post_item = posts_container.read_item(item=post_id, partition_key=board_id)
+            post_item = read_post(board_id, post_id)
         except exceptions.CosmosResourceNotFoundError:
             return response_json({"error": "Post not found"}, 404)
+        was_accepted = bool(post_item.get("isAccept"))
         # apply update
         post_item["isAccept"] = bool(accept)
         if not bool(accept):
@@ -691,6 +2171,9 @@ def admin_accept_post(board_id, post_id):
             post_item.pop("isRejected", None)
             post_item.pop("rejected_at", None)
         posts_container.replace_item(item=post_id, body=post_item)
+        if bool(accept) != was_accepted:
+            update_search_index(post_item, remove=not bool(accept))
+        update_hot_posts(post_item, remove=not bool(accept))
         return response_json({"post_id": post_id, "isAccept": bool(accept)})
     except Exception as e:
         return response_json({"error": str(e)}, 500)
@@ -714,6 +2197,7 @@ def admin_accept_comment(board_id, post_id, comment_id):
             )
         except exceptions.CosmosResourceNotFoundError:
             return response_json({"error": "Comment not found"}, 404)
+        was_accepted = bool(c_item.get("isAccept"))
         c_item["isAccept"] = bool(accept)
         if not bool(accept):
             c_item["isRejected"] = True
@@ -724,6 +2208,9 @@ def admin_accept_comment(board_id, post_id, comment_id):
             c_item.pop("isRejected", None)
             c_item.pop("rejected_at", None)
         comments_container.replace_item(item=comment_id, body=c_item)
+        update_cached_comment(c_item)
+        if bool(accept) != was_accepted:
+            update_search_index(c_item, remove=not bool(accept))
         return response_json({"comment_id": comment_id, "isAccept": bool(accept)})
     except Exception as e:
         return response_json({"error": str(e)}, 500)
@@ -741,12 +2228,12 @@ def admin_list_pending_posts(board_id):
             "ORDER BY c.created_at DESC"
         )
         items = list(
-            posts_container.query_items(
-                query=query,
-                parameters=[{"name": "@board_id", "value": board_id}],
-                partition_key=board_id,
+            query_board_posts(
+                board_id, query, [{"name": "@board_id", "value": board_id}]
             )
         )
+        if POSTS_LAYOUT == "monthly":
+            items.sort(key=lambda it: it.get("created_at") or "", reverse=True)
         posts = []
         for it in items:
             d = dict(it)
@@ -818,5 +2305,31 @@ def admin_list_all_pending_comments(board_id):
         return response_json({"error": str(e)}, 500)
 
 
+@app.route("/admin/boards/<board_id>/export", methods=["GET"])
+def admin_export_board(board_id):
+    # Only suits small boards: Mangum buffers the whole body before returning it
+    # and Lambda caps response size, so large boards go through `flask board-export`
+    if not _require_admin():
+        return response_json({"error": "Forbidden"}, 403)
+    return Response(
+        gzip_stream(export_ndjson(export_board_docs(board_id))),
+        content_type="application/gzip",
+        headers={"Content-Disposition": f'attachment; filename="{board_id}.ndjson.gz"'},
+    )
+
+
+@app.route("/admin/metrics/likes", methods=["GET"])
+def admin_like_filter_metrics():
+    if not _require_admin():
+        return response_json({"error": "Forbidden"}, 403)
+    stats = dict(LIKE_FILTER_STATS)
+    checks = stats["checks"]
+    stats["hit_rate"] = (
+        (stats["hits"] + stats["shared_hits"]) / checks if checks else 0.0
+    )
+    stats["tracked_posts"] = len(LIKE_FILTERS)
+    return response_json(stats)
+
+
 if __name__ == "__main__":
     app.run(host="0.0.0.0", debug=True)